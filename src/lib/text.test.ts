@@ -1,5 +1,5 @@
 import { describe, expect, it } from 'vitest';
-import { convertCase, getTextStats } from './text';
+import { collapseBlankRuns, convertCase, countLines, escapeHtml, getTextStats, stripFootnoteNumber } from './text';
 
 describe('convertCase', () => {
   it('converts text to snake case', () => {
@@ -22,4 +22,81 @@ describe('getTextStats', () => {
       readingMinutes: 1
     });
   });
+
+  it('counts CRLF lines and paragraphs split by whitespace-only lines', () => {
+    expect(getTextStats('One.\r\n  \r\nTwo\nthree.\n\n\n\nFour')).toMatchObject({
+      words: 4,
+      lines: 8,
+      sentences: 2,
+      paragraphs: 3
+    });
+  });
+
+  it('reports zeroes for empty input', () => {
+    expect(getTextStats('')).toMatchObject({ words: 0, lines: 0, sentences: 0, paragraphs: 0 });
+  });
+});
+
+describe('countLines', () => {
+  it('treats LF, CR and CRLF as single line breaks', () => {
+    expect(countLines('a\nb')).toBe(2);
+    expect(countLines('a\rb')).toBe(2);
+    expect(countLines('a\r\nb')).toBe(2);
+    expect(countLines('a\r\n\rb\n')).toBe(4);
+  });
+
+  it('counts a trailing newline as starting a new line', () => {
+    expect(countLines('a\n')).toBe(2);
+  });
+
+  it('reports zero for empty input', () => {
+    expect(countLines('')).toBe(0);
+  });
+});
+
+describe('escapeHtml', () => {
+  it('escapes markup and quote characters', () => {
+    expect(escapeHtml(`<a href="x">Tom & Jerry's</a>`)).toBe('&lt;a href=&quot;x&quot;&gt;Tom &amp; Jerry&#39;s&lt;/a&gt;');
+  });
+
+  it('leaves plain text untouched', () => {
+    expect(escapeHtml('plain text')).toBe('plain text');
+  });
+});
+
+describe('collapseBlankRuns', () => {
+  it('collapses runs of whitespace-only lines to one empty line', () => {
+    expect(collapseBlankRuns('a\n\n\n\nb')).toBe('a\n\nb');
+    expect(collapseBlankRuns('a\n \n\t\n  b')).toBe('a\n\n  b');
+  });
+
+  it('keeps a lone blank line as is', () => {
+    expect(collapseBlankRuns('a\n  \nb')).toBe('a\n  \nb');
+  });
+
+  it('does not count the trailing newline as a blank line', () => {
+    expect(collapseBlankRuns('a\n')).toBe('a\n');
+    expect(collapseBlankRuns('a\n\n')).toBe('a\n\n');
+    expect(collapseBlankRuns('a\n\n\n')).toBe('a\n\n');
+  });
+});
+
+describe('stripFootnoteNumber', () => {
+  it('drops a leading note number', () => {
+    expect(stripFootnoteNumber('12. The note.')).toBe('The note.');
+    expect(stripFootnoteNumber('[3] The note.')).toBe('The note.');
+    expect(stripFootnoteNumber(' [4] . The note.')).toBe('The note.');
+  });
+
+  it('leaves text without a leading number untouched', () => {
+    expect(stripFootnoteNumber('[a] The note.')).toBe('[a] The note.');
+    expect(stripFootnoteNumber('  See page 4.')).toBe('  See page 4.');
+  });
+
+  it('matches the regex it replaces', () => {
+    const samples = ['', ' ', '7', '[7', '7]', '[]', '[ 7]', '7 .x', '7.. x', '\u00a0[12]\t.\u00a0x', '[7]]', '1a. b', '.7 x'];
+    for (const sample of samples) {
+      expect(stripFootnoteNumber(sample)).toBe(sample.replace(/^\s*\[?\d+\]?\s*\.?\s*/, ''));
+    }
+  });
 });
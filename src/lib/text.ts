@@ -47,20 +47,92 @@ export function convertCase(text: string, mode: CaseMode): string {
 
 export function getTextStats(text: string): TextStats {
   const trimmed = text.trim();
-  const words = trimmed ? (trimmed.match(/\S+/g) ?? []).length : 0;
-  const sentenceMatches = trimmed.match(/[.!?]+(?:\s|$)/g) ?? [];
-  const paragraphs = trimmed ? trimmed.split(/\n\s*\n/).filter(Boolean).length : 0;
+  const words = trimmed ? countMatches(trimmed, /\S+/g) : 0;
+  const paragraphs = trimmed ? countMatches(trimmed, /\n\s*\n/g) + 1 : 0;
 
   return {
     characters: text.length,
     words,
-    lines: text.length ? text.split(/\r?\n/).length : 0,
-    sentences: sentenceMatches.length,
+    lines: text.length ? countNewlines(text) + 1 : 0,
+    sentences: countMatches(trimmed, /[.!?]+(?:\s|$)/g),
     paragraphs,
     readingMinutes: words === 0 ? 0 : Math.max(1, Math.ceil(words / 225))
   };
 }
 
+export function countLines(text: string): number {
+  if (!text) return 0;
+  let lines = 1;
+  for (let index = 0; index < text.length; index += 1) {
+    const code = text.charCodeAt(index);
+    if (code === 10) {
+      lines += 1;
+    } else if (code === 13) {
+      lines += 1;
+      if (text.charCodeAt(index + 1) === 10) index += 1;
+    }
+  }
+  return lines;
+}
+
+const htmlEscapes: Record<string, string> = { '&': '&amp;', '<': '&lt;', '>': '&gt;', '"': '&quot;', "'": '&#39;' };
+
+export function escapeHtml(text: string): string {
+  return text.replace(/[&<>"']/g, (char) => htmlEscapes[char]);
+}
+
+const blankLinePattern = /^[ \t]*$/;
+
+export function collapseBlankRuns(text: string): string {
+  const endsWithNewline = text.endsWith('\n');
+  const lines = (endsWithNewline ? text.slice(0, -1) : text).split('\n');
+  const out: string[] = [];
+  let blankRun = 0;
+  let lastBlank = '';
+  for (const line of lines) {
+    if (blankLinePattern.test(line)) {
+      blankRun += 1;
+      lastBlank = line;
+      continue;
+    }
+    if (blankRun) out.push(blankRun === 1 ? lastBlank : '');
+    blankRun = 0;
+    out.push(line);
+  }
+  if (blankRun) out.push(blankRun === 1 ? lastBlank : '');
+  return out.join('\n') + (endsWithNewline ? '\n' : '');
+}
+
+export function stripFootnoteNumber(text: string): string {
+  const isSpace = (index: number) => index < text.length && text[index].trim() === '';
+  let pos = 0;
+  while (isSpace(pos)) pos += 1;
+  if (text[pos] === '[') pos += 1;
+  const digitsStart = pos;
+  while (pos < text.length && text.charCodeAt(pos) >= 48 && text.charCodeAt(pos) <= 57) pos += 1;
+  if (pos === digitsStart) return text;
+  if (text[pos] === ']') pos += 1;
+  while (isSpace(pos)) pos += 1;
+  if (text[pos] === '.') pos += 1;
+  while (isSpace(pos)) pos += 1;
+  return text.slice(pos);
+}
+
+// `pattern` must be global and must never match an empty string.
+function countMatches(text: string, pattern: RegExp): number {
+  let count = 0;
+  while (pattern.exec(text)) count += 1;
+  return count;
+}
+
+function countNewlines(text: string): number {
+  let count = 0;
+  for (let index = text.indexOf('\n'); index !== -1; index = text.indexOf('\n', index + 1)) {
+    count += 1;
+  }
+  return count;
+}
+
 function capitalize(word: string): string {
   return word.charAt(0).toUpperCase() + word.slice(1).toLowerCase();
 }
@@ -16,10 +16,9 @@ const LANG_NAMES: Record<string, string> = {
 };
 
 // Determine which files actually exist in the snippets folder
-const availableLangs = Object.keys(snippetLoaders).map(path => {
-    const parts = path.split('/');
-    return parts[parts.length - 1].replace('.json', '');
-});
+const availableLangs = new Set(Object.keys(snippetLoaders).map(path =>
+    path.slice(path.lastIndexOf('/') + 1, -'.json'.length)
+));
 
 let activeSnippetData: any = null;
 let currentRawContent = '';
@@ -46,7 +45,7 @@ function populateCategories() {
     
     // Only show categories that have at least one available snippet file
     const activeCategories = Object.keys(CATEGORY_MAP).filter(cat => {
-        return CATEGORY_MAP[cat].some(lang => availableLangs.includes(lang));
+        return CATEGORY_MAP[cat].some(lang => availableLangs.has(lang));
     }).sort();
 
     activeCategories.forEach(catKey => {
@@ -65,7 +64,7 @@ function populateLanguages(category: string) {
     
     // Only show languages in this category that actually exist in our folder
     const options = CATEGORY_MAP[category]
-        .filter(langKey => availableLangs.includes(langKey))
+        .filter(langKey => availableLangs.has(langKey))
         .map(langKey => ({
             text: LANG_NAMES[langKey] || langKey,
             value: langKey